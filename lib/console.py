@@ -237,6 +237,11 @@ class StatusDisplay:
         self.lines.append("")
         return self
 
+    def set_line(self, index: int, line: str) -> "StatusDisplay":
+        """Replace an existing line (for updating a prebuilt layout)."""
+        self.lines[index] = line
+        return self
+
     def render(self, in_place: bool = True) -> str:
         """
         Render and print the display.
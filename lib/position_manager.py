@@ -47,7 +47,7 @@ class Position:
     entry_time: float
     order_id: Optional[str] = None
 
-    # TP/SL config (set by PositionManager)
+    # TP/SL config (set per position by PositionManager)
     take_profit_delta: float = 0.10
     stop_loss_delta: float = 0.05
 
@@ -140,6 +140,8 @@ class PositionManager:
         entry_price: float,
         size: float,
         order_id: Optional[str] = None,
+        take_profit: Optional[float] = None,
+        stop_loss: Optional[float] = None,
     ) -> Optional[Position]:
         """
         Open a new position.
@@ -150,6 +152,8 @@ class PositionManager:
             entry_price: Entry price
             size: Position size
             order_id: Optional order ID
+            take_profit: Take profit delta for this position (defaults to manager's)
+            stop_loss: Stop loss delta for this position (defaults to manager's)
 
         Returns:
             Position if opened, None if at max positions
@@ -171,8 +175,8 @@ class PositionManager:
             size=size,
             entry_time=time.time(),
             order_id=order_id,
-            take_profit_delta=self.take_profit,
-            stop_loss_delta=self.stop_loss,
+            take_profit_delta=self.take_profit if take_profit is None else take_profit,
+            stop_loss_delta=self.stop_loss if stop_loss is None else stop_loss,
         )
 
         self._positions[pos_id] = position
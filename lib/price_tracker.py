@@ -2,10 +2,11 @@
 Price Tracker - Price History and Flash Crash Detection
 
 Provides:
-- Price history storage with timestamps
-- Flash crash detection (absolute probability drops)
+- Price history storage with timestamps (fixed-size numpy ring buffers)
+- Numba-compiled window scans when numba is installed
+- Flash crash detection (absolute or relative probability drops)
 - Price point data structures
-- Configurable lookback windows
+- Configurable lookback windows and sides
 
 Usage:
     from lib import PriceTracker, FlashCrashEvent
@@ -23,9 +24,52 @@ Usage:
 """
 
 import time
-from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Deque, List
+from typing import Callable, Optional, Dict, List, Tuple
+
+import numpy as np
+
+
+def _load_jit() -> Callable:
+    """Resolve numba's njit decorator, or a pass-through if numba is not installed."""
+    try:
+        from numba import njit
+        return njit(cache=True)
+    except ImportError:
+        return lambda func: func
+
+
+_jit = _load_jit()
+
+
+@_jit
+def _find_drop(
+    ts: np.ndarray, px: np.ndarray, cutoff: float, threshold: float, relative: bool
+) -> Tuple[bool, float, float]:
+    """Compare the oldest price at/after cutoff with the latest price."""
+    n = px.shape[0]
+    if n < 2:
+        return False, 0.0, 0.0
+
+    idx = np.searchsorted(ts, cutoff)
+    if idx >= n:
+        return False, 0.0, 0.0
+
+    old_price = px[idx]
+    new_price = px[n - 1]
+    limit = threshold * old_price if relative else threshold
+    return old_price - new_price >= limit, old_price, new_price
+
+
+@_jit
+def _price_range(ts: np.ndarray, px: np.ndarray, cutoff: float) -> Tuple[float, float]:
+    """Get (min, max) of prices at/after cutoff, or (0, 0) if none."""
+    start = np.searchsorted(ts, cutoff)
+    if start >= px.shape[0]:
+        return 0.0, 0.0
+
+    window = px[start:]
+    return window.min(), window.max()
 
 
 @dataclass
@@ -62,67 +106,109 @@ class PriceTracker:
 
     A flash crash is when the probability drops by more than the threshold
     within the lookback window (e.g., 0.30 means price drops from 0.5 to 0.2).
+    With relative_drop=True the threshold is a fraction of the older price
+    instead (e.g., 0.30 means a 30% drop).
+
+    History is kept in preallocated numpy ring buffers. Each sample is written
+    twice (at slot i and i + max_history) so the most recent samples are always
+    available as one contiguous, time-ordered view without copying.
+
+    With min_interval > 0, a sample arriving within min_interval seconds of a
+    side's last stored sample replaces that sample's price instead of taking a
+    new slot, so max_history * min_interval bounds the time span kept.
     """
 
     lookback_seconds: int = 10
     drop_threshold: float = 0.30
     max_history: int = 100
+    sides: Tuple[str, ...] = ("up", "down")
+    relative_drop: bool = False
+    min_interval: float = 0.0
 
-    # Price history per side
-    _history: Dict[str, Deque[PricePoint]] = field(default_factory=dict)
+    # Ring buffers per side
+    _ts: Dict[str, np.ndarray] = field(default_factory=dict)
+    _px: Dict[str, np.ndarray] = field(default_factory=dict)
+    _count: Dict[str, int] = field(default_factory=dict)
 
     def __post_init__(self):
-        """Initialize history deques."""
-        self._history = {
-            "up": deque(maxlen=self.max_history),
-            "down": deque(maxlen=self.max_history),
-        }
+        """Allocate ring buffers."""
+        size = 2 * self.max_history
+        self._ts = {side: np.zeros(size, dtype=np.float64) for side in self.sides}
+        self._px = {side: np.zeros(size, dtype=np.float64) for side in self.sides}
+        self._count = {side: 0 for side in self.sides}
+
+        # Compile the kernels now rather than on the first trading tick
+        dummy = np.zeros(2, dtype=np.float64)
+        _find_drop(dummy, dummy, 0.0, self.drop_threshold, self.relative_drop)
+        _price_range(dummy, dummy, 0.0)
+
+    def _window(self, side: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get time-ordered (timestamps, prices) views of a side's history."""
+        count = self._count[side]
+        n = min(count, self.max_history)
+        end = (count - 1) % self.max_history + 1 + self.max_history
+        return self._ts[side][end - n:end], self._px[side][end - n:end]
 
     def record(self, side: str, price: float, timestamp: Optional[float] = None) -> None:
         """
         Record a price point.
 
         Args:
-            side: "up" or "down"
+            side: Side name (e.g. "up" or "down")
             price: Current price (0-1)
             timestamp: Optional timestamp (defaults to now)
         """
-        if side not in self._history:
+        if side not in self._count:
             return
 
         if price <= 0:
             return
 
         ts = timestamp if timestamp is not None else time.time()
-        self._history[side].append(PricePoint(timestamp=ts, price=price, side=side))
-
-    def record_prices(self, prices: Dict[str, float]) -> None:
+        count = self._count[side]
+        if count and self.min_interval > 0:
+            last = (count - 1) % self.max_history
+            if ts - self._ts[side][last] < self.min_interval:
+                self._px[side][last] = self._px[side][last + self.max_history] = price
+                return
+
+        slot = count % self.max_history
+        self._ts[side][slot] = self._ts[side][slot + self.max_history] = ts
+        self._px[side][slot] = self._px[side][slot + self.max_history] = price
+        self._count[side] += 1
+
+    def record_prices(self, prices: Dict[str, float], timestamp: Optional[float] = None) -> None:
         """
         Record multiple prices at once.
 
         Args:
             prices: Dictionary of {side: price}
+            timestamp: Optional timestamp (defaults to now)
         """
-        now = time.time()
+        now = timestamp if timestamp is not None else time.time()
         for side, price in prices.items():
             self.record(side, price, now)
 
     def get_history(self, side: str) -> List[PricePoint]:
         """Get price history for a side."""
-        if side in self._history:
-            return list(self._history[side])
-        return []
+        if side not in self._count:
+            return []
+        timestamps, prices = self._window(side)
+        return [
+            PricePoint(timestamp=float(ts), price=float(price), side=side)
+            for ts, price in zip(timestamps, prices)
+        ]
 
     def get_history_count(self, side: str) -> int:
         """Get number of recorded prices for a side."""
-        if side in self._history:
-            return len(self._history[side])
+        if side in self._count:
+            return min(self._count[side], self.max_history)
         return 0
 
     def get_current_price(self, side: str) -> float:
         """Get most recent price for a side."""
-        if side in self._history and self._history[side]:
-            return self._history[side][-1].price
+        if side in self._count and self._count[side]:
+            return float(self._window(side)[1][-1])
         return 0.0
 
     def get_price_at(self, side: str, seconds_ago: float) -> Optional[float]:
@@ -130,21 +216,20 @@ class PriceTracker:
         Get price from N seconds ago.
 
         Args:
-            side: "up" or "down"
+            side: Side name
             seconds_ago: How far back to look
 
         Returns:
             Price at that time or None
         """
-        if side not in self._history:
+        if side not in self._count:
             return None
 
-        now = time.time()
-        target_time = now - seconds_ago
+        timestamps, prices = self._window(side)
+        idx = np.searchsorted(timestamps, time.time() - seconds_ago)
 
-        for point in self._history[side]:
-            if point.timestamp >= target_time:
-                return point.price
+        if idx < len(prices):
+            return float(prices[idx])
 
         return None
 
@@ -153,44 +238,33 @@ class PriceTracker:
         Detect if a flash crash occurred.
 
         Args:
-            side: Specific side to check, or None to check both
+            side: Specific side to check, or None to check all sides
 
         Returns:
             FlashCrashEvent if crash detected, None otherwise
         """
-        sides_to_check = [side] if side else ["up", "down"]
+        sides_to_check = [side] if side else self.sides
         now = time.time()
 
         for s in sides_to_check:
-            if s not in self._history:
-                continue
-
-            history = self._history[s]
-            if len(history) < 2:
-                continue
-
-            # Get current price
-            current_price = history[-1].price
-
-            # Find price from lookback_seconds ago
-            old_price = None
-            for point in history:
-                if now - point.timestamp <= self.lookback_seconds:
-                    old_price = point.price
-                    break
-
-            if old_price is None:
+            if s not in self._count:
                 continue
 
-            # Calculate absolute drop
-            drop = old_price - current_price
+            timestamps, prices = self._window(s)
+            crashed, old_price, current_price = _find_drop(
+                timestamps,
+                prices,
+                now - self.lookback_seconds,
+                self.drop_threshold,
+                self.relative_drop,
+            )
 
-            if drop >= self.drop_threshold:
+            if crashed:
                 return FlashCrashEvent(
                     side=s,
-                    old_price=old_price,
-                    new_price=current_price,
-                    drop=drop,
+                    old_price=float(old_price),
+                    new_price=float(current_price),
+                    drop=float(old_price - current_price),
                     timestamp=now,
                 )
 
@@ -204,7 +278,7 @@ class PriceTracker:
             List of FlashCrashEvent for all detected crashes
         """
         events = []
-        for side in ["up", "down"]:
+        for side in self.sides:
             event = self.detect_flash_crash(side)
             if event:
                 events.append(event)
@@ -218,42 +292,36 @@ class PriceTracker:
             side: Specific side to clear, or None to clear all
         """
         if side:
-            if side in self._history:
-                self._history[side].clear()
+            if side in self._count:
+                self._count[side] = 0
         else:
-            for s in self._history:
-                self._history[s].clear()
+            for s in self._count:
+                self._count[s] = 0
 
     def get_price_range(self, side: str, seconds: float) -> tuple[float, float]:
         """
         Get min/max price over the last N seconds.
 
         Args:
-            side: "up" or "down"
+            side: Side name
             seconds: Lookback window
 
         Returns:
             Tuple of (min_price, max_price), or (0, 0) if no data
         """
-        if side not in self._history:
-            return (0.0, 0.0)
-
-        now = time.time()
-        cutoff = now - seconds
-
-        prices = [p.price for p in self._history[side] if p.timestamp >= cutoff]
-
-        if not prices:
+        if side not in self._count:
             return (0.0, 0.0)
 
-        return (min(prices), max(prices))
+        timestamps, prices = self._window(side)
+        min_price, max_price = _price_range(timestamps, prices, time.time() - seconds)
+        return (float(min_price), float(max_price))
 
     def get_volatility(self, side: str, seconds: float) -> float:
         """
         Calculate price volatility (max - min) over the last N seconds.
 
         Args:
-            side: "up" or "down"
+            side: Side name
             seconds: Lookback window
 
         Returns:
@@ -17,9 +17,10 @@ import os
 import sys
 import time
 import asyncio
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Any, Callable, Coroutine, Iterable, NamedTuple, Optional, Dict, List
+from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -27,62 +28,104 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src import TradingBot, Config
 from src.gamma_client import GammaClient
+from src.http import ThreadLocalSessionMixin, json_loads
+from src.websocket_client import MarketWebSocket, OrderbookSnapshot, PriceChange
 from lib import PriceTracker, PositionManager
 from lib.console import Colors, log, StatusDisplay, format_pnl
+import numpy as np
 import requests
 
 
+# Market schedule is in US Eastern time (handles DST)
+ET = ZoneInfo("America/New_York")
+TRADING_START_HOUR = 8
+TRADING_END_HOUR = 11
+SETTLEMENT_HOUR = 12
+
+
+class SideQuote(NamedTuple):
+    """Which order book quote prices a side."""
+    outcome: str  # Token traded on this side
+    book_index: int  # Index into the stream's (best_bid, best_ask)
+    levels: str  # REST book levels holding that quote
+    best: Callable[[Iterable[float]], float]  # Picks the best of those levels
+
+
+# Lower strike trades NO at the ask, upper strike trades YES at the bid.
+# REST levels go through min/max rather than [0]: the REST book's level
+# ordering is not guaranteed to put the best price first.
+SIDE_QUOTES = {
+    'lower': SideQuote('NO', 1, 'asks', min),
+    'upper': SideQuote('YES', 0, 'bids', max),
+}
+
+BOOK_BATCH_SIZE = 100  # Max queued updates applied per wakeup
+REST_FALLBACK_INTERVAL = 2.0  # Min seconds between REST book fetches per side
+
+# Exit targets (V5c): entry price bucket x volatility bucket -> TP delta.
+# Price buckets: <=1.5c, <=3c, above. Volatility buckets: <=0.05, <=0.10, above.
+EXIT_PRICE_BINS = np.array([0.015, 0.030])
+EXIT_VOL_BINS = np.array([0.05, 0.10])
+EXIT_DELTAS = np.array([
+    [0.20, 0.20, 0.20],
+    [0.12, 0.15, 0.18],
+    [0.12, 0.12, 0.12],
+])
+EXIT_CAP_CHEAP = 0.30  # Max exit target for the cheapest bucket
+
+# Entry signals, in display order
+SIGNALS = ("PANIC_DIP", "HIGH_VOL", "MED_VOL")
+SIGNAL_IDX = {signal: i for i, signal in enumerate(SIGNALS)}
+
+
+class _BinanceSession(ThreadLocalSessionMixin):
+    """Thread-local keep-alive session for Binance price lookups."""
+
+
+_binance = _BinanceSession()
+
+
 def get_btc_price() -> float:
     """Get current BTC price from Binance."""
     try:
-        resp = requests.get("https://api.binance.com/api/v3/ticker/price?symbol=BTCUSDT", timeout=5)
-        return float(resp.json()['price'])
-    except:
+        resp = _binance.session.get("https://api.binance.com/api/v3/ticker/price?symbol=BTCUSDT", timeout=5)
+        return float(json_loads(resp.content)['price'])
+    except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+        log(f"BTC price lookup failed: {e}", "error")
         return 0.0
 
 
-def calculate_strikes(btc_price: float) -> tuple[int, int]:
-    """Calculate adjacent $2k strikes (same as V5c backtest)."""
-    lower = (int(btc_price) // 2000) * 2000
-    upper = lower + 2000
-    return lower, upper
+def _et_timestamp(day: date, hour: int) -> float:
+    """Get epoch seconds of an hour (ET wall clock) on a given day."""
+    return datetime(day.year, day.month, day.day, hour, tzinfo=ET).timestamp()
 
 
-def find_daily_market(strike: int, date_str: str) -> Optional[str]:
-    """
-    Find daily market slug for given strike and date.
-    
-    Format: "bitcoin-above-{strike}k-on-{month}-{day}"
-    Example: "bitcoin-above-88k-on-january-21"
+def trading_window(now: float) -> tuple[date, float, float, float]:
     """
-    strike_k = strike // 1000
-    gamma = GammaClient()
-    slug = f"bitcoin-above-{strike_k}k-on-{date_str}"
+    Get the next trading window that has not closed yet.
     
-    market = gamma.get_market_by_slug(slug)
-    if market:
-        return slug
+    Once today's window has closed (11am ET) this is tomorrow's, so a bot
+    started in the afternoon or evening targets the next day's markets.
     
-    return None
+    Returns:
+        Tuple of (ET date, start, end, settlement), times as epoch seconds
+    """
+    day = datetime.fromtimestamp(now, ET).date()
+    if now >= _et_timestamp(day, TRADING_END_HOUR):
+        day += timedelta(days=1)
+    return (
+        day,
+        _et_timestamp(day, TRADING_START_HOUR),
+        _et_timestamp(day, TRADING_END_HOUR),
+        _et_timestamp(day, SETTLEMENT_HOUR),
+    )
 
 
-def get_token_ids_for_market(slug: str) -> Optional[Dict[str, str]]:
-    """Get YES/NO token IDs for a market slug."""
-    gamma = GammaClient()
-    market = gamma.get_market_by_slug(slug)
-    
-    if not market:
-        return None
-    
-    try:
-        token_ids = gamma.parse_token_ids(market)
-        # Daily markets have YES/NO, map to upper/lower
-        return {
-            'yes': token_ids.get('yes', ''),
-            'no': token_ids.get('no', '')
-        }
-    except:
-        return None
+def calculate_strikes(btc_price: float) -> tuple[int, int]:
+    """Calculate adjacent $2k strikes (same as V5c backtest)."""
+    lower = (int(btc_price) // 2000) * 2000
+    upper = lower + 2000
+    return lower, upper
 
 
 class DailyMarketBot:
@@ -104,7 +147,11 @@ class DailyMarketBot:
         # Price tracking & positions
         self.price_tracker = PriceTracker(
             lookback_seconds=10,
-            drop_threshold=0.30
+            drop_threshold=0.30,  # 30% of the price 10s ago
+            relative_drop=True,
+            max_history=1000,  # >= 100s of history at min_interval, above the 60s volatility window
+            min_interval=0.1,  # At most 10 samples/s per side
+            sides=("lower", "upper"),
         )
         self.position_mgr = PositionManager(
             take_profit=0.15,
@@ -113,23 +160,45 @@ class DailyMarketBot:
         )
         
         # Market state
-        self.lower_strike = 0
-        self.upper_strike = 0
-        self.lower_token_id = ""
-        self.upper_token_id = ""
+        self.strike: Dict[str, int] = {}
+        self.token_id: Dict[str, str] = {}
         self.market_slugs = {}
+        self._side_by_token: Dict[str, str] = {}
+        
+        # Trading window bounds (epoch seconds, set in initialize)
+        self._t_start = 0.0
+        self._t_end = 0.0
+        self._t_settle = 0.0
+        
+        # Market metadata is fixed for the day, so fetch each slug once
+        self._gamma = GammaClient()
+        self._market_cache: Dict[str, Dict] = {}
+        
+        # Live top-of-book (pushed by the WebSocket stream)
+        self._ws: Optional[MarketWebSocket] = None
+        self._ws_task: Optional[asyncio.Task] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._book_queue: asyncio.Queue = asyncio.Queue()
+        self._books: Dict[str, tuple[float, float]] = {}  # token_id -> (best_bid, best_ask)
+        self._tick_event = asyncio.Event()
+        self._rest_fetched: Dict[str, float] = {}  # side -> last REST fetch (monotonic)
+        
+        # Status display (built once markets are known)
+        self._display: Optional[StatusDisplay] = None
+        self._is_tty = sys.stdout.isatty()
+        self._last_render = 0.0
         
         # Stats
         self.session_start = time.time()
-        self.entry_signals = {"PANIC_DIP": 0, "HIGH_VOL": 0, "MED_VOL": 0}
-        self.signal_pnl = {"PANIC_DIP": 0.0, "HIGH_VOL": 0.0, "MED_VOL": 0.0}
+        self._signal_counts = np.zeros(len(SIGNALS), dtype=np.int32)
+        self._signal_pnl = np.zeros(len(SIGNALS))
     
     async def initialize(self) -> bool:
         """Find today's daily markets."""
         log("Initializing daily market bot...", "info")
         
-        # Get current BTC price
-        btc_price = get_btc_price()
+        # Get current BTC price (blocking HTTP, run in thread pool)
+        btc_price = await asyncio.to_thread(get_btc_price)
         if btc_price == 0:
             log("Failed to get BTC price", "error")
             return False
@@ -137,54 +206,147 @@ class DailyMarketBot:
         log(f"BTC Price: ${btc_price:,.2f}", "info")
         
         # Calculate strikes
-        self.lower_strike, self.upper_strike = calculate_strikes(btc_price)
-        log(f"Lower Strike: ${self.lower_strike:,}", "info")
-        log(f"Upper Strike: ${self.upper_strike:,}", "info")
+        lower_strike, upper_strike = calculate_strikes(btc_price)
+        self.strike = {'lower': lower_strike, 'upper': upper_strike}
+        log(f"Lower Strike: ${lower_strike:,}", "info")
+        log(f"Upper Strike: ${upper_strike:,}", "info")
         
         # Check distance filter (±$900 from midpoint like V5c)
-        midpoint = (self.lower_strike + self.upper_strike) / 2
+        midpoint = (lower_strike + upper_strike) / 2
         distance = abs(btc_price - midpoint)
         if distance > 900:
             log(f"BTC too far from strikes (${distance:.0f} > $900) - skipping today", "warning")
             return False
         
-        # Get today's date string (format: january-22)
-        now = datetime.now(timezone.utc)
-        date_str = now.strftime("%B-%d").lower()
+        # Next open trading window (8-11am ET) and settlement (noon ET)
+        day, self._t_start, self._t_end, self._t_settle = trading_window(time.time())
+        
+        # Market date string (format: january-22)
+        date_str = day.strftime("%B-%d").lower()
         
         # Find markets
         log(f"Searching for markets on {date_str}...", "info")
         
-        lower_slug = find_daily_market(self.lower_strike, date_str)
-        upper_slug = find_daily_market(self.upper_strike, date_str)
+        lower, upper = await asyncio.gather(
+            asyncio.to_thread(self._resolve_market, lower_strike, date_str),
+            asyncio.to_thread(self._resolve_market, upper_strike, date_str),
+        )
         
-        if not lower_slug or not upper_slug:
+        if not lower or not upper:
             log("Could not find daily markets", "error")
             return False
         
-        # Get token IDs
-        lower_tokens = get_token_ids_for_market(lower_slug)
-        upper_tokens = get_token_ids_for_market(upper_slug)
-        
-        if not lower_tokens or not upper_tokens:
-            log("Could not get token IDs", "error")
-            return False
+        lower_slug, lower_tokens = lower
+        upper_slug, upper_tokens = upper
+        self.market_slugs = {'lower': lower_slug, 'upper': upper_slug}
         
         # For lower strike: trade NO (bet BTC stays below)
         # For upper strike: trade YES (bet BTC goes above)
-        self.lower_token_id = lower_tokens['no']
-        self.upper_token_id = upper_tokens['yes']
+        self.token_id = {'lower': lower_tokens['no'], 'upper': upper_tokens['yes']}
+        self._side_by_token = {token_id: side for side, token_id in self.token_id.items()}
         
-        log(f"Lower NO token: {self.lower_token_id[:16]}...", "success")
-        log(f"Upper YES token: {self.upper_token_id[:16]}...", "success")
+        log(f"Lower NO token: {self.token_id['lower'][:16]}...", "success")
+        log(f"Upper YES token: {self.token_id['upper'][:16]}...", "success")
+        
+        # Stream order book updates instead of polling REST
+        await self._start_book_stream()
         
         return True
     
-    def is_trading_hours(self) -> bool:
+    async def _start_book_stream(self) -> None:
+        """Subscribe to both strike tokens and queue top-of-book updates."""
+        self._ws = MarketWebSocket()
+        
+        @self._ws.on_book
+        def handle_book(snapshot: OrderbookSnapshot):  # pyright: ignore[reportUnusedFunction]
+            self._book_queue.put_nowait((snapshot.asset_id, snapshot.best_bid, snapshot.best_ask))
+        
+        @self._ws.on_price_change
+        def handle_price_change(market: str, changes: List[PriceChange]):  # pyright: ignore[reportUnusedFunction]
+            for change in changes:
+                self._book_queue.put_nowait((change.asset_id, change.best_bid, change.best_ask))
+        
+        @self._ws.on_disconnect
+        def handle_disconnect():  # pyright: ignore[reportUnusedFunction]
+            # Drop cached quotes so the REST fallback is used until the next snapshot
+            while not self._book_queue.empty():
+                self._book_queue.get_nowait()
+            self._books.clear()
+        
+        await self._ws.subscribe(list(self.token_id.values()))
+        self._consumer_task = asyncio.create_task(self._consume_book_updates())
+        self._ws_task = asyncio.create_task(self._ws.run(auto_reconnect=True))
+    
+    async def _stop_book_stream(self) -> None:
+        """Stop the WebSocket stream and its consumer."""
+        for task in (self._ws_task, self._consumer_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._ws_task = None
+        self._consumer_task = None
+        
+        if self._ws:
+            await self._ws.disconnect()
+            self._ws = None
+    
+    async def _consume_book_updates(self) -> None:
+        """Apply queued book updates in batches, waking the main loop once per batch."""
+        while True:
+            updates = [await self._book_queue.get()]
+            while len(updates) < BOOK_BATCH_SIZE and not self._book_queue.empty():
+                updates.append(self._book_queue.get_nowait())
+            
+            # Later updates overwrite earlier ones, leaving the freshest book per token
+            for asset_id, best_bid, best_ask in updates:
+                if asset_id in self._side_by_token:
+                    self._books[asset_id] = (best_bid, best_ask)
+            
+            self._tick_event.set()
+    
+    def _get_market(self, slug: str) -> Optional[Dict]:
+        """Get market data by slug, cached for the session."""
+        market = self._market_cache.get(slug)
+        if market is None:
+            market = self._gamma.get_market_by_slug(slug)
+            if market:
+                self._market_cache[slug] = market
+        return market
+    
+    def _resolve_market(self, strike: int, date_str: str) -> Optional[tuple[str, Dict[str, str]]]:
+        """
+        Find the daily market for a strike and its YES/NO token IDs.
+        
+        Slug format: "bitcoin-above-{strike}k-on-{month}-{day}"
+        Example: "bitcoin-above-88k-on-january-21"
+        
+        Returns:
+            Tuple of (slug, {'yes': token_id, 'no': token_id}), or None
+        """
+        slug = f"bitcoin-above-{strike // 1000}k-on-{date_str}"
+        market = self._get_market(slug)
+        
+        if not market:
+            return None
+        
+        try:
+            token_ids = self._gamma.parse_token_ids(market)
+            return slug, {
+                'yes': token_ids.get('yes', ''),
+                'no': token_ids.get('no', '')
+            }
+        except (TypeError, ValueError) as e:
+            log(f"Could not parse token IDs for {slug}: {e}", "error")
+            return None
+    
+    def is_trading_hours(self, now: Optional[float] = None) -> bool:
         """Check if within 8am-11am ET trading window."""
-        now = datetime.now(timezone.utc)
-        hour_et = (now.hour - 5) % 24  # Convert UTC to ET (rough)
-        return 8 <= hour_et < 11
+        if now is None:
+            now = time.time()
+        return self._t_start <= now < self._t_end
     
     def calculate_exit_target(self, entry_price: float, volatility: float) -> float:
         """
@@ -192,17 +354,13 @@ class DailyMarketBot:
         
         Best trades: entries 0.7-4.5¢ → exits 15-30¢ (6-21x returns)
         """
-        if entry_price <= 0.015:
-            return min(entry_price + 0.20, 0.30)
-        elif entry_price <= 0.030:
-            if volatility > 0.10:
-                return entry_price + 0.18
-            elif volatility > 0.05:
-                return entry_price + 0.15
-            else:
-                return entry_price + 0.12
-        else:
-            return entry_price + 0.12
+        price_idx = EXIT_PRICE_BINS.searchsorted(entry_price)
+        vol_idx = EXIT_VOL_BINS.searchsorted(volatility)
+        target = entry_price + float(EXIT_DELTAS[price_idx, vol_idx])
+        
+        if price_idx == 0:
+            return min(target, EXIT_CAP_CHEAP)
+        return target
     
     def should_enter(self, side: str, current_price: float) -> tuple[bool, str]:
         """
@@ -234,34 +392,73 @@ class DailyMarketBot:
         
         return False, "no_signal"
     
-    async def get_current_prices(self) -> Dict[str, float]:
-        """Get current market prices for both strikes."""
+    def get_current_prices(self) -> Dict[str, float]:
+        """Get current market prices for both strikes from the stream cache."""
         prices = {}
+        for side, token_id in self.token_id.items():
+            book = self._books.get(token_id)
+            if book and 0 < book[SIDE_QUOTES[side].book_index] < 1:
+                prices[side] = book[SIDE_QUOTES[side].book_index]
+        return prices
+    
+    def _rest_fallback_sides(self) -> List[str]:
+        """
+        Get sides due a REST book fetch.
         
-        # Get lower strike NO price
-        try:
-            book = await self.bot.clob_client.get_order_book(self.lower_token_id)
-            if book and 'asks' in book and book['asks']:
-                prices['lower'] = float(book['asks'][0]['price'])
-        except:
-            pass
+        Only tokens without a stream snapshot (not yet received, or dropped on
+        disconnect) fall back to REST, at most once per REST_FALLBACK_INTERVAL.
+        A snapshot with an empty bid/ask side is kept as "no price": REST would
+        return the same empty book.
+        """
+        now = time.monotonic()
+        sides = []
+        for side, token_id in self.token_id.items():
+            if token_id in self._books:
+                continue
+            last = self._rest_fetched.get(side)
+            if last is None or now - last >= REST_FALLBACK_INTERVAL:
+                self._rest_fetched[side] = now
+                sides.append(side)
+        return sides
+    
+    async def fetch_book_prices(self, sides: List[str]) -> Dict[str, float]:
+        """
+        Fetch strike prices over REST (fallback for sides the stream has no data for).
         
-        # Get upper strike YES price
-        try:
-            book = await self.bot.clob_client.get_order_book(self.upper_token_id)
-            if book and 'bids' in book and book['bids']:
-                prices['upper'] = float(book['bids'][0]['price'])
-        except:
-            pass
+        Args:
+            sides: Sides to fetch ('lower' and/or 'upper')
+        
+        Returns:
+            Dictionary of {side: price} for sides with a usable book
+        """
+        books = await asyncio.gather(
+            *(self.bot.get_order_book(self.token_id[side]) for side in sides),
+            return_exceptions=True,
+        )
+        prices = {}
+        
+        for side, book in zip(sides, books):
+            if isinstance(book, asyncio.CancelledError):
+                raise book
+            if isinstance(book, BaseException):
+                log(f"Order book fetch failed ({side}): {book}", "error")
+                continue
+            
+            quote = SIDE_QUOTES[side]
+            try:
+                if book and book.get(quote.levels):
+                    prices[side] = quote.best(float(level['price']) for level in book[quote.levels])
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                log(f"Bad order book data ({side}): {e}", "error")
         
         return prices
     
     async def place_entry_order(self, side: str, price: float, reason: str) -> bool:
         """Place entry order."""
-        token_id = self.lower_token_id if side == 'lower' else self.upper_token_id
+        token_id = self.token_id[side]
+        strike = self.strike[side]
         size = self.position_size / price
         
-        strike = self.lower_strike if side == 'lower' else self.upper_strike
         log(f"Entering {side.upper()} ${strike:,}: {size:.1f} @ {price:.3f} ({reason})", "trade")
         
         try:
@@ -277,20 +474,20 @@ class DailyMarketBot:
                 exit_target = self.calculate_exit_target(price, volatility)
                 stop_delta = price * 0.50
                 
-                self.position_mgr.take_profit = exit_target - price
-                self.position_mgr.stop_loss = stop_delta
-                
+                # TP/SL are stored on the position, not the shared manager
                 position = self.position_mgr.open_position(
                     side=side,
                     token_id=token_id,
                     entry_price=price,
                     size=size,
-                    order_id=result.order_id
+                    order_id=result.order_id,
+                    take_profit=exit_target - price,
+                    stop_loss=stop_delta,
                 )
                 
                 if position:
                     position.entry_reason = reason
-                    self.entry_signals[reason] = self.entry_signals.get(reason, 0) + 1
+                    self._signal_counts[SIGNAL_IDX[reason]] += 1
                     log(f"Position opened: TP {exit_target:.3f} | SL {price - stop_delta:.3f}", "success")
                     return True
         except Exception as e:
@@ -315,79 +512,158 @@ class DailyMarketBot:
                 
                 if result.success:
                     entry_reason = getattr(position, 'entry_reason', 'UNKNOWN')
-                    if entry_reason in self.signal_pnl:
-                        self.signal_pnl[entry_reason] += pnl
+                    signal_idx = SIGNAL_IDX.get(entry_reason)
+                    if signal_idx is not None:
+                        self._signal_pnl[signal_idx] += pnl
                     
                     self.position_mgr.close_position(position.id, realized_pnl=pnl)
                     log(f"Closed: {format_pnl(pnl)} | Signal: {entry_reason}", "success")
             except Exception as e:
                 log(f"Exit error: {e}", "error")
     
-    def render_status(self, prices: Dict[str, float]) -> None:
-        """Display live status."""
+    def _build_display(self) -> None:
+        """Build the static status frame once and record the dynamic line slots."""
         display = StatusDisplay(width=80)
         
+        def slot() -> int:
+            display.add_blank()
+            return len(display.lines) - 1
+        
         display.add_bold_separator("=")
         display.add_header("Daily BTC Market Bot - V5c Strategy")
         display.add_bold_separator("=")
         display.add_blank()
         
         # Market info
-        now = datetime.now(timezone.utc)
-        noon_et = now.replace(hour=17, minute=0, second=0)  # Noon ET = 5pm UTC
-        remaining = (noon_et - now).total_seconds()
-        mins = int(remaining // 60)
-        secs = int(remaining % 60)
-        
         display.add_line(f"{Colors.BOLD}Strikes:{Colors.RESET}")
-        display.add_line(f"  Lower: ${self.lower_strike:,} (NO)")
-        display.add_line(f"  Upper: ${self.upper_strike:,} (YES)")
-        display.add_line(f"{Colors.BOLD}Settlement:{Colors.RESET} {mins:02d}:{secs:02d} until noon ET")
+        for side in self.token_id:
+            display.add_line(f"  {side.capitalize()}: ${self.strike[side]:,} ({SIDE_QUOTES[side].outcome})")
+        self._idx_countdown = slot()
         display.add_blank()
         
         # Prices
         display.add_line(f"{Colors.BOLD}Current Prices:{Colors.RESET}")
-        display.add_line(f"  Lower NO:  {prices.get('lower', 0):.4f}")
-        display.add_line(f"  Upper YES: {prices.get('upper', 0):.4f}")
+        self._idx_prices = {side: slot() for side in self.token_id}
         display.add_blank()
         
-        # Positions
-        positions = self.position_mgr.get_all_positions()
-        display.add_line(f"{Colors.BOLD}Positions ({len(positions)}):{Colors.RESET}")
+        # Positions (at most one per side)
+        self._idx_positions_header = slot()
+        self._idx_positions = {side: slot() for side in self.token_id}
+        display.add_blank()
         
-        if positions:
-            for pos in positions:
-                current = prices.get(pos.side, 0)
+        # Stats
+        display.add_line(f"{Colors.BOLD}Stats:{Colors.RESET}")
+        self._idx_trades = slot()
+        self._idx_total_pnl = slot()
+        display.add_blank()
+        self._idx_signals = [slot() for _ in SIGNALS]
+        
+        display.add_blank()
+        display.add_separator()
+        self._display = display
+    
+    def render_status(self, prices: Dict[str, float], now: Optional[float] = None) -> None:
+        """Display live status."""
+        if self._display is None:
+            self._build_display()
+        display = self._display
+        stats = self.position_mgr.get_stats()
+        
+        # Market info
+        remaining = self._t_settle - (now if now is not None else time.time())
+        mins = int(remaining // 60)
+        secs = int(remaining % 60)
+        display.set_line(
+            self._idx_countdown,
+            f"{Colors.BOLD}Settlement:{Colors.RESET} {mins:02d}:{secs:02d} until noon ET"
+        )
+        
+        # Prices
+        for side, idx in self._idx_prices.items():
+            label = f"{side.capitalize()} {SIDE_QUOTES[side].outcome}:"
+            display.set_line(idx, f"  {label:<11}{prices.get(side, 0):.4f}")
+        
+        # Positions
+        display.set_line(
+            self._idx_positions_header,
+            f"{Colors.BOLD}Positions ({stats['open_positions']}):{Colors.RESET}"
+        )
+        unrealized_pnl = 0.0
+        for side, idx in self._idx_positions.items():
+            pos = self.position_mgr.get_position_by_side(side)
+            if pos:
+                current = prices.get(side, 0)
                 pnl = pos.get_pnl(current) if current > 0 else 0
+                unrealized_pnl += pnl
                 hold_time = int(pos.get_hold_time())
-                
-                display.add_line(
-                    f"  {pos.side.upper()}: {pos.entry_price:.3f} → {current:.3f} | "
+                display.set_line(
+                    idx,
+                    f"  {side.upper()}: {pos.entry_price:.3f} → {current:.3f} | "
                     f"{format_pnl(pnl)} | {hold_time}s"
                 )
-        else:
-            display.add_line("  No positions")
-        
-        display.add_blank()
+            else:
+                display.set_line(idx, f"  {side.upper()}: no position")
         
         # Stats
-        stats = self.position_mgr.get_stats()
-        total_pnl = self.position_mgr.get_total_pnl(prices)
+        total_pnl = stats['total_pnl'] + unrealized_pnl
         
-        display.add_line(f"{Colors.BOLD}Stats:{Colors.RESET}")
-        display.add_line(f"  Trades: {stats['trades_closed']} | Win Rate: {stats['win_rate']:.1f}%")
-        display.add_line(f"  Total PnL: {format_pnl(total_pnl)}")
+        display.set_line(
+            self._idx_trades,
+            f"  Trades: {stats['trades_closed']} | Win Rate: {stats['win_rate']:.1f}%"
+        )
+        display.set_line(self._idx_total_pnl, f"  Total PnL: {format_pnl(total_pnl)}")
         
-        if self.entry_signals:
-            display.add_blank()
-            for signal, count in self.entry_signals.items():
-                pnl = self.signal_pnl.get(signal, 0.0)
-                display.add_line(f"  {signal}: {count} | {format_pnl(pnl)}")
+        for signal, idx, count, pnl in zip(
+            SIGNALS, self._idx_signals, self._signal_counts, self._signal_pnl
+        ):
+            display.set_line(idx, f"  {signal}: {count} | {format_pnl(pnl)}")
         
-        display.add_blank()
-        display.add_separator()
         display.render(in_place=True)
     
+    def log_status(self, prices: Dict[str, float]) -> None:
+        """Log a one-line status summary (for non-terminal output)."""
+        stats = self.position_mgr.get_stats()
+        total_pnl = self.position_mgr.get_total_pnl(prices)
+        quotes = " | ".join(
+            f"{side.capitalize()} {SIDE_QUOTES[side].outcome} {prices.get(side, 0):.4f}"
+            for side in self.token_id
+        )
+        log(
+            f"{quotes} | "
+            f"Positions: {stats['open_positions']} | Trades: {stats['trades_closed']} | "
+            f"PnL: {format_pnl(total_pnl)}",
+            "info"
+        )
+    
+    def _maybe_render(self, prices: Dict[str, float], now: float) -> None:
+        """Render the status screen at most 1Hz on a TTY, else log a summary once a minute."""
+        elapsed = time.monotonic() - self._last_render
+        if self._is_tty:
+            if elapsed >= 1.0:
+                self.render_status(prices, now)
+                self._last_render = time.monotonic()
+        elif elapsed >= 60.0:
+            self.log_status(prices)
+            self._last_render = time.monotonic()
+    
+    async def _wait_for_tick(self, timeout: float) -> bool:
+        """
+        Wait for the next price update from the book stream.
+        
+        Args:
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if woken by an update, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._tick_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._tick_event.clear()
+    
     async def run(self) -> None:
         """Main trading loop."""
         if not await self.initialize():
@@ -397,27 +673,36 @@ class DailyMarketBot:
         
         try:
             while True:
-                # Check trading hours
-                if not self.is_trading_hours():
+                # One clock read per tick, shared by the checks below
+                now = time.time()
+                
+                # Check trading hours (the window is fixed to the market's day)
+                if now >= self._t_end:
+                    log("Trading window closed (11am ET) - stopping", "warning")
+                    break
+                if not self.is_trading_hours(now):
                     log("Outside trading hours (8-11am ET)", "warning")
-                    await asyncio.sleep(60)
+                    await asyncio.sleep(min(60.0, self._t_start - now))
                     continue
                 
-                # Get prices
-                prices = await self.get_current_prices()
+                # Get prices (REST fallback for sides the stream has no book for)
+                prices = self.get_current_prices()
+                rest_sides = self._rest_fallback_sides()
+                if rest_sides:
+                    prices.update(await self.fetch_book_prices(rest_sides))
                 
                 if not prices:
-                    await asyncio.sleep(5)
+                    await self._wait_for_tick(timeout=5.0)
                     continue
                 
                 # Record for flash crash detection
-                self.price_tracker.record_prices(prices)
+                self.price_tracker.record_prices(prices, timestamp=now)
                 
                 # Check exits
                 await self.check_exits(prices)
                 
                 # Check entries
-                for side in ['lower', 'upper']:
+                for side in self.token_id:
                     if side not in prices:
                         continue
                     
@@ -426,13 +711,15 @@ class DailyMarketBot:
                         await self.place_entry_order(side, prices[side], reason)
                 
                 # Display status
-                self.render_status(prices)
+                self._maybe_render(prices, now)
                 
-                await asyncio.sleep(2)
+                # Wake on the next book update (refresh display at least every 2s)
+                await self._wait_for_tick(timeout=2.0)
                 
         except KeyboardInterrupt:
             log("\nShutting down...", "warning")
         finally:
+            await self._stop_book_stream()
             stats = self.position_mgr.get_stats()
             log(f"Final: {stats['trades_closed']} trades | {format_pnl(stats['total_pnl'])}", "info")
 
@@ -452,5 +739,15 @@ async def main():
     await bot.run()
 
 
+def run_event_loop(coro: Coroutine[Any, Any, None]) -> None:
+    """Run on uvloop's event loop if installed (lower scheduling overhead than asyncio's)."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+        return
+    uvloop.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -267,6 +267,9 @@ class TradingBot:
 
     async def _run_in_thread(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """Run a blocking call in a worker thread to avoid event loop stalls."""
+        # ClobClient is requests-based and ThreadLocalSessionMixin keeps one
+        # keep-alive session per worker thread, so connections are already
+        # reused; a shared aiohttp session is not needed here.
         return await asyncio.to_thread(func, *args, **kwargs)
 
     def is_initialized(self) -> bool:
@@ -38,7 +38,7 @@ from dataclasses import dataclass
 import requests
 
 from .config import BuilderConfig
-from .http import ThreadLocalSessionMixin
+from .http import ThreadLocalSessionMixin, json_loads
 
 
 class ApiError(Exception):
@@ -161,9 +161,9 @@ class ApiClient(ThreadLocalSessionMixin):
                     raise ApiError(f"Unsupported method: {method}")
 
                 response.raise_for_status()
-                return response.json() if response.text else {}
+                return json_loads(response.content) if response.content else {}
 
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
                 last_error = e
                 if attempt < self.retry_count - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
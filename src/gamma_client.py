@@ -16,7 +16,7 @@ import json
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 
-from .http import ThreadLocalSessionMixin
+from .http import ThreadLocalSessionMixin, json_loads
 
 
 class GammaClient(ThreadLocalSessionMixin):
@@ -63,7 +63,7 @@ class GammaClient(ThreadLocalSessionMixin):
         try:
             response = self.session.get(url, timeout=self.timeout)
             if response.status_code == 200:
-                return response.json()
+                return json_loads(response.content)
             return None
         except Exception:
             return None
@@ -1,15 +1,29 @@
 """
 HTTP Utilities - Shared HTTP session helpers.
 
-Provides a thread-local requests.Session mixin to avoid cross-thread reuse.
+Provides a thread-local requests.Session mixin to avoid cross-thread reuse,
+and a JSON decoder that uses orjson when it is installed.
 """
 
+import json
 import threading
-from typing import Any
+from typing import Any, Callable, Union
 
 import requests
 
 
+def _load_json_decoder() -> Callable[[Union[str, bytes]], Any]:
+    """Resolve the fastest available JSON decoder (orjson if installed)."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        return json.loads
+
+
+json_loads = _load_json_decoder()
+
+
 class ThreadLocalSessionMixin:
     """
     Mixin providing a thread-local requests.Session.
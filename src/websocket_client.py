@@ -24,6 +24,8 @@ import logging
 from typing import Optional, Dict, Any, List, Callable, Set, Union, Awaitable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from .http import json_loads
+
 if TYPE_CHECKING:
     from websockets.client import WebSocketClientProtocol
 
@@ -490,7 +492,7 @@ class MarketWebSocket:
                 if msg_count <= 5 or msg_count % 1000 == 0:
                     logger.info(f"WS message #{msg_count}: {message[:200] if len(message) > 200 else message}")
 
-                data = json.loads(message)
+                data = json_loads(message)
 
                 # Handle array of messages
                 if isinstance(data, list):
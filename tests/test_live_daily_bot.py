@@ -0,0 +1,310 @@
+"""
+Unit tests for the daily market bot's price path.
+"""
+
+import asyncio
+import sys
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import live_daily_bot
+from live_daily_bot import ET, DailyMarketBot, trading_window
+from src.websocket_client import OrderbookLevel, OrderbookSnapshot, PriceChange
+
+
+class FakeMarketWebSocket:
+    """Stands in for MarketWebSocket: records callbacks, never connects."""
+
+    def __init__(self):
+        self.on_book_cb = None
+        self.on_price_change_cb = None
+        self.on_disconnect_cb = None
+
+    def on_book(self, callback):
+        self.on_book_cb = callback
+        return callback
+
+    def on_price_change(self, callback):
+        self.on_price_change_cb = callback
+        return callback
+
+    def on_disconnect(self, callback):
+        self.on_disconnect_cb = callback
+        return callback
+
+    async def subscribe(self, asset_ids, replace=False):
+        return True
+
+    async def run(self, auto_reconnect=True):
+        await asyncio.Event().wait()
+
+    async def disconnect(self):
+        pass
+
+
+def make_snapshot(asset_id, bid=None, ask=None):
+    return OrderbookSnapshot(
+        asset_id=asset_id,
+        market="m",
+        timestamp=0,
+        bids=[OrderbookLevel(price=bid, size=10.0)] if bid is not None else [],
+        asks=[OrderbookLevel(price=ask, size=10.0)] if ask is not None else [],
+    )
+
+
+@pytest_asyncio.fixture
+async def streaming_bot(monkeypatch):
+    monkeypatch.setattr(live_daily_bot, "MarketWebSocket", FakeMarketWebSocket)
+    bot = DailyMarketBot()
+    bot.token_id = {"lower": "no_token", "upper": "yes_token"}
+    bot._side_by_token = {token_id: side for side, token_id in bot.token_id.items()}
+    await bot._start_book_stream()
+    yield bot
+    await bot._stop_book_stream()
+
+
+async def drain(bot):
+    """Let the consumer task apply everything queued so far."""
+    while not bot._book_queue.empty():
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_stream_prices_use_side_quote(streaming_bot):
+    ws = streaming_bot._ws
+    ws.on_book_cb(make_snapshot("no_token", bid=0.02, ask=0.03))
+    ws.on_book_cb(make_snapshot("yes_token", bid=0.04, ask=0.05))
+    await drain(streaming_bot)
+
+    assert streaming_bot.get_current_prices() == {"lower": 0.03, "upper": 0.04}
+    assert streaming_bot._rest_fallback_sides() == []
+
+
+@pytest.mark.asyncio
+async def test_empty_book_side_is_no_price_without_rest(streaming_bot):
+    ws = streaming_bot._ws
+    ws.on_book_cb(make_snapshot("no_token", bid=0.02, ask=0.03))
+    ws.on_book_cb(make_snapshot("yes_token", ask=0.05))  # No bids
+    await drain(streaming_bot)
+
+    assert streaming_bot.get_current_prices() == {"lower": 0.03}
+    assert streaming_bot._rest_fallback_sides() == []
+
+
+@pytest.mark.asyncio
+async def test_rest_fallback_only_without_snapshot_and_rate_limited(streaming_bot):
+    ws = streaming_bot._ws
+    ws.on_book_cb(make_snapshot("no_token", bid=0.02, ask=0.03))
+    await drain(streaming_bot)
+
+    assert streaming_bot._rest_fallback_sides() == ["upper"]
+    assert streaming_bot._rest_fallback_sides() == []
+
+    streaming_bot._rest_fetched["upper"] -= live_daily_bot.REST_FALLBACK_INTERVAL
+    assert streaming_bot._rest_fallback_sides() == ["upper"]
+
+
+@pytest.mark.asyncio
+async def test_rest_prices_use_best_level_per_side():
+    bot = DailyMarketBot()
+    bot.token_id = {"lower": "no_token", "upper": "yes_token"}
+
+    class FakeTradingBot:
+        async def get_order_book(self, token_id):
+            return {
+                "bids": [{"price": "0.01"}, {"price": "0.02"}],
+                "asks": [{"price": "0.05"}, {"price": "0.03"}],
+            }
+
+    bot.bot = FakeTradingBot()
+
+    assert await bot.fetch_book_prices(["upper", "lower"]) == {"upper": 0.02, "lower": 0.03}
+    assert await bot.fetch_book_prices(["lower"]) == {"lower": 0.03}
+
+
+class CountingEvent(asyncio.Event):
+    def __init__(self):
+        super().__init__()
+        self.set_calls = 0
+
+    def set(self):
+        self.set_calls += 1
+        super().set()
+
+
+def price_change(asset_id, bid, ask):
+    return PriceChange(asset_id=asset_id, price=bid, size=1.0, side="BUY", best_bid=bid, best_ask=ask)
+
+
+@pytest.mark.asyncio
+async def test_burst_keeps_latest_book_per_token_and_wakes_once(streaming_bot):
+    streaming_bot._tick_event = CountingEvent()
+    ws = streaming_bot._ws
+
+    # Queued synchronously, so the consumer sees the whole burst in one batch
+    ws.on_book_cb(make_snapshot("no_token", bid=0.01, ask=0.02))
+    for i in range(10):
+        ws.on_price_change_cb("m", [
+            price_change("no_token", 0.01, 0.02 + i * 0.001),
+            price_change("yes_token", 0.04 + i * 0.001, 0.06),
+        ])
+    await drain(streaming_bot)
+
+    assert streaming_bot._books == {"no_token": (0.01, 0.029), "yes_token": (0.049, 0.06)}
+    assert streaming_bot._tick_event.set_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_updates_for_unknown_assets_are_ignored(streaming_bot):
+    ws = streaming_bot._ws
+    ws.on_book_cb(make_snapshot("other_token", bid=0.40, ask=0.45))
+    ws.on_price_change_cb("m", [price_change("other_token", 0.41, 0.44)])
+    ws.on_book_cb(make_snapshot("yes_token", bid=0.04, ask=0.05))
+    await drain(streaming_bot)
+
+    assert streaming_bot._books == {"yes_token": (0.04, 0.05)}
+
+
+@pytest.mark.asyncio
+async def test_disconnect_clears_books_and_queue(streaming_bot):
+    ws = streaming_bot._ws
+    ws.on_book_cb(make_snapshot("no_token", bid=0.02, ask=0.03))
+    ws.on_book_cb(make_snapshot("yes_token", bid=0.04, ask=0.05))
+    await drain(streaming_bot)
+
+    # A stale update still queued when the stream drops must not come back
+    ws.on_book_cb(make_snapshot("no_token", bid=0.01, ask=0.02))
+    ws.on_disconnect_cb()
+    await drain(streaming_bot)
+
+    assert streaming_bot._books == {}
+    assert streaming_bot._book_queue.empty()
+    assert streaming_bot.get_current_prices() == {}
+    assert streaming_bot._rest_fallback_sides() == ["lower", "upper"]
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def window_bot(now):
+    bot = DailyMarketBot()
+    day, bot._t_start, bot._t_end, bot._t_settle = trading_window(now)
+    return day, bot
+
+
+@pytest.mark.parametrize("now, day, start_utc_hour", [
+    (utc(2026, 3, 7, 14), date(2026, 3, 7), 13),  # EST: 8am ET = 13:00 UTC
+    (utc(2026, 3, 9, 14), date(2026, 3, 9), 12),  # EDT after spring-forward
+    (utc(2026, 11, 1, 14), date(2026, 11, 1), 13),  # EST after fall-back
+])
+def test_trading_window_follows_dst(now, day, start_utc_hour):
+    window_day, start, end, settle = trading_window(now)
+
+    assert window_day == day
+    assert start == utc(day.year, day.month, day.day, start_utc_hour)
+    assert end - start == 3 * 3600
+    assert settle - start == 4 * 3600
+
+
+def test_trading_window_rolls_to_next_day_after_close():
+    # 7pm ET on Jan 21 is already Jan 22 in UTC
+    assert trading_window(utc(2026, 1, 22, 0))[0] == date(2026, 1, 22)
+    # Afternoon ET, still Jan 21 in UTC
+    assert trading_window(utc(2026, 1, 21, 20))[0] == date(2026, 1, 22)
+    # Just before and at 11am ET
+    assert trading_window(utc(2026, 1, 21, 15, 59))[0] == date(2026, 1, 21)
+    assert trading_window(utc(2026, 1, 21, 16))[0] == date(2026, 1, 22)
+
+
+def test_trading_window_day_spans_utc_midnight():
+    # 11:30pm ET on Mar 7 (04:30 UTC Mar 8) targets Mar 8, DST starting that night
+    day, start, end, _ = trading_window(utc(2026, 3, 8, 4, 30))
+
+    assert day == date(2026, 3, 8)
+    assert datetime.fromtimestamp(start, ET).hour == 8
+    assert start == utc(2026, 3, 8, 12)
+
+
+@pytest.mark.parametrize("now, expected", [
+    (utc(2026, 3, 9, 11, 59), False),  # 7:59am EDT
+    (utc(2026, 3, 9, 12), True),  # 8:00am EDT
+    (utc(2026, 3, 9, 14, 59), True),  # 10:59am EDT
+    (utc(2026, 3, 9, 15), False),  # 11:00am EDT
+])
+def test_is_trading_hours_in_edt(now, expected):
+    _, bot = window_bot(utc(2026, 3, 9, 5))
+
+    assert bot.is_trading_hours(now) is expected
+
+
+@pytest.mark.parametrize("now, expected", [
+    (utc(2026, 3, 6, 12, 30), False),  # 7:30am EST
+    (utc(2026, 3, 6, 13), True),  # 8:00am EST
+    (utc(2026, 3, 6, 15, 30), True),  # 10:30am EST
+    (utc(2026, 3, 6, 16), False),  # 11:00am EST
+])
+def test_is_trading_hours_in_est(now, expected):
+    _, bot = window_bot(utc(2026, 3, 6, 5))
+
+    assert bot.is_trading_hours(now) is expected
+
+
+@pytest.mark.asyncio
+async def test_run_returns_once_window_has_closed(monkeypatch):
+    _, bot = window_bot(utc(2026, 3, 9, 5))
+
+    async def fake_initialize():
+        return True
+
+    monkeypatch.setattr(bot, "initialize", fake_initialize)
+    monkeypatch.setattr(live_daily_bot.time, "time", lambda: utc(2026, 3, 9, 15))
+
+    await asyncio.wait_for(bot.run(), timeout=1.0)
+
+
+def reference_exit_target(entry_price, volatility):
+    """Branching V5c exit target that the lookup table replaced."""
+    if entry_price <= 0.015:
+        return min(entry_price + 0.20, 0.30)
+    elif entry_price <= 0.030:
+        if volatility > 0.10:
+            return entry_price + 0.18
+        elif volatility > 0.05:
+            return entry_price + 0.15
+        else:
+            return entry_price + 0.12
+    else:
+        return entry_price + 0.12
+
+
+def around(value):
+    """A bucket edge and the nearest floats on either side of it."""
+    return [np.nextafter(value, 0.0), value, np.nextafter(value, 1.0)]
+
+
+def test_exit_target_table_matches_reference():
+    bot = DailyMarketBot()
+    entry_prices = [0.001, 0.005, *around(0.015), 0.02, *around(0.030), 0.06, 0.10, 0.5]
+    volatilities = [0.0, 0.01, *around(0.05), 0.07, *around(0.10), 0.2, 1.0]
+
+    for entry_price in entry_prices:
+        for volatility in volatilities:
+            expected = reference_exit_target(entry_price, volatility)
+            assert bot.calculate_exit_target(entry_price, volatility) == expected, (
+                entry_price, volatility
+            )
+
+
+def test_exit_target_cap_applies_to_cheapest_bucket_only(monkeypatch):
+    bot = DailyMarketBot()
+    monkeypatch.setattr(live_daily_bot, "EXIT_CAP_CHEAP", 0.20)
+
+    assert bot.calculate_exit_target(0.015, 0.2) == 0.20
+    assert abs(bot.calculate_exit_target(0.030, 0.2) - 0.21) < 1e-9
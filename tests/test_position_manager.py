@@ -0,0 +1,48 @@
+"""
+Unit tests for PositionManager TP/SL handling.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.position_manager import PositionManager
+
+
+def test_open_position_uses_manager_defaults():
+    manager = PositionManager(take_profit=0.10, stop_loss=0.05)
+    pos = manager.open_position(side="up", token_id="1", entry_price=0.40, size=10.0)
+
+    assert abs(pos.take_profit_price - 0.50) < 1e-9
+    assert abs(pos.stop_loss_price - 0.35) < 1e-9
+
+
+def test_per_position_thresholds_do_not_change_manager():
+    manager = PositionManager(take_profit=0.10, stop_loss=0.05, max_positions=2)
+    lower = manager.open_position(
+        side="lower", token_id="1", entry_price=0.02, size=100.0,
+        take_profit=0.18, stop_loss=0.01,
+    )
+    upper = manager.open_position(side="upper", token_id="2", entry_price=0.40, size=10.0)
+
+    assert abs(lower.take_profit_price - 0.20) < 1e-9
+    assert abs(lower.stop_loss_price - 0.01) < 1e-9
+    assert upper.take_profit_delta == 0.10
+    assert manager.take_profit == 0.10
+    assert manager.stop_loss == 0.05
+
+
+def test_check_all_exits_reads_position_thresholds():
+    manager = PositionManager(max_positions=3)
+    manager.open_position(side="a", token_id="1", entry_price=0.02, size=1.0, take_profit=0.10)
+    manager.open_position(side="b", token_id="2", entry_price=0.50, size=1.0, stop_loss=0.20)
+    manager.open_position(side="c", token_id="3", entry_price=0.50, size=1.0)
+
+    exits = manager.check_all_exits({"a": 0.15, "b": 0.30, "c": 0.52})
+
+    assert [(pos.side, exit_type) for pos, exit_type, _ in exits] == [
+        ("a", "take_profit"),
+        ("b", "stop_loss"),
+    ]
+    assert abs(exits[0][2] - 0.13) < 1e-9
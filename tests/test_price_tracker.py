@@ -0,0 +1,98 @@
+"""
+Unit tests for PriceTracker ring buffers and flash crash detection.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.price_tracker import PriceTracker
+
+
+def test_history_wraps_in_time_order():
+    tracker = PriceTracker(max_history=3)
+    for i in range(5):
+        tracker.record("up", 0.1 * (i + 1), timestamp=1000.0 + i)
+
+    history = tracker.get_history("up")
+
+    assert tracker.get_history_count("up") == 3
+    assert [p.timestamp for p in history] == [1002.0, 1003.0, 1004.0]
+    assert tracker.get_current_price("up") == 0.5
+
+
+def test_ignores_unknown_side_and_non_positive_price():
+    tracker = PriceTracker()
+    tracker.record("sideways", 0.5)
+    tracker.record("up", 0.0)
+
+    assert tracker.get_history_count("sideways") == 0
+    assert tracker.get_history_count("up") == 0
+
+
+def test_detect_flash_crash_absolute():
+    tracker = PriceTracker(lookback_seconds=10, drop_threshold=0.30)
+    now = time.time()
+    tracker.record("up", 0.60, timestamp=now - 20)  # Outside lookback
+    tracker.record("up", 0.55, timestamp=now - 5)
+    tracker.record("up", 0.20, timestamp=now)
+
+    event = tracker.detect_flash_crash()
+
+    assert event is not None
+    assert event.side == "up"
+    assert event.old_price == 0.55
+    assert event.new_price == 0.20
+
+
+def test_detect_flash_crash_relative_with_custom_sides():
+    tracker = PriceTracker(
+        drop_threshold=0.30,
+        relative_drop=True,
+        sides=("lower", "upper"),
+    )
+    now = time.time()
+    tracker.record("lower", 0.040, timestamp=now - 5)
+    tracker.record("lower", 0.025, timestamp=now)
+    tracker.record("upper", 0.040, timestamp=now - 5)
+    tracker.record("upper", 0.035, timestamp=now)
+
+    assert tracker.detect_flash_crash("lower") is not None
+    assert tracker.detect_flash_crash("upper") is None
+
+
+def test_volatility_uses_window_only():
+    tracker = PriceTracker()
+    now = time.time()
+    tracker.record("down", 0.90, timestamp=now - 120)
+    tracker.record("down", 0.40, timestamp=now - 30)
+    tracker.record("down", 0.50, timestamp=now)
+
+    assert abs(tracker.get_volatility("down", seconds=60) - 0.10) < 1e-9
+
+
+def test_clear_resets_history():
+    tracker = PriceTracker()
+    tracker.record("up", 0.5)
+    tracker.record("down", 0.5)
+
+    tracker.clear("up")
+    assert tracker.get_history_count("up") == 0
+    assert tracker.get_history_count("down") == 1
+
+    tracker.clear()
+    assert tracker.get_history_count("down") == 0
+    assert tracker.get_price_range("down", 60) == (0.0, 0.0)
+
+
+def test_min_interval_caps_sample_rate():
+    tracker = PriceTracker(max_history=10, min_interval=1.0)
+    now = time.time()
+    for i in range(50):
+        tracker.record("up", 0.50 + i * 0.001, timestamp=now + i * 0.1)
+
+    # 5 seconds at 10 samples/s collapse into one sample per second
+    assert tracker.get_history_count("up") == 5
+    assert abs(tracker.get_current_price("up") - 0.549) < 1e-9